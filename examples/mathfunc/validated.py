@@ -0,0 +1,25 @@
+# type: ignore
+# ruff: noqa
+
+from everest.config import EverestConfig
+
+from ropt_everest import create_ensemble_evaluator, create_optimizer, run_everest
+
+
+def run(evaluator):
+    config = EverestConfig.load_file("config_example.yml")
+    optimizer = create_optimizer(evaluator)
+    tracker = optimizer.add_tracker()
+    optimizer.run(config)
+
+    ensemble_evaluator = create_ensemble_evaluator(evaluator)
+    store = ensemble_evaluator.add_store()
+    ensemble_evaluator.run(config, controls=tracker.controls)
+    print(store.dataframe("results"))
+
+
+if __name__ == "__main__":
+    import warnings
+
+    warnings.filterwarnings("ignore")
+    run_everest("config_example.yml", script=__file__)
@@ -24,11 +24,28 @@ class EverestDefaultCachedEvaluator(DefaultCachedEvaluator):
         results, cached = self.eval_cached(variables, context)
         sim_ids = results.evaluation_info.get("sim_ids")
         if sim_ids is not None:
-            batch_ids = np.full_like(sim_ids, results.batch_id)
-            for idx, (cached_realization_index, item) in cached.items():
-                evaluation_info = item.evaluations.evaluation_info
-                sim_ids[idx] = evaluation_info["sim_ids"][cached_realization_index]
-                batch_ids[idx] = item.batch_id
+            if cached:
+                count = len(cached)
+                indices = np.fromiter(cached.keys(), dtype=np.intp, count=count)
+                batch_ids = np.empty_like(sim_ids)
+                uncached = np.ones(sim_ids.shape, dtype=np.bool_)
+                uncached[indices] = False
+                batch_ids[uncached] = results.batch_id
+                sim_ids[indices] = np.fromiter(
+                    (
+                        item.evaluations.evaluation_info["sim_ids"][realization]
+                        for realization, item in cached.values()
+                    ),
+                    dtype=sim_ids.dtype,
+                    count=count,
+                )
+                batch_ids[indices] = np.fromiter(
+                    (item.batch_id for _, item in cached.values()),
+                    dtype=batch_ids.dtype,
+                    count=count,
+                )
+            else:
+                batch_ids = np.full_like(sim_ids, results.batch_id)
             results.evaluation_info["sim_ids"] = sim_ids
             results.evaluation_info["batch_ids"] = batch_ids
         return results
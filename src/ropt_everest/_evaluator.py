@@ -1,27 +1,23 @@
 from __future__ import annotations
 
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from ropt.config import EnOptConfig
 from ropt.enums import ExitCode
 from ropt.plugins.compute_step.ensemble_evaluator import (
     DefaultEnsembleEvaluatorComputeStep,
 )
-from ropt.transforms import OptModelTransforms
 from ropt.workflow import create_compute_step
 
 from ._handler_mixin import HandlerMixin
+from ._utils import everest_to_ropt
 
 if TYPE_CHECKING:
+    from everest.config import EverestConfig
     from numpy.typing import ArrayLike
     from ropt.enums import ExitCode
     from ropt.plugins.evaluator.base import Evaluator
 
 
-# ruff: noqa: PLC0415
-
-
 class EverestEnsembleEvaluator(HandlerMixin, DefaultEnsembleEvaluatorComputeStep):
     """The Everest ensemble evaluator class.
 
@@ -47,7 +43,7 @@ class EverestEnsembleEvaluator(HandlerMixin, DefaultEnsembleEvaluatorComputeStep
 
     def run(  # type: ignore[override]
         self,
-        config: dict[str, Any],
+        config: dict[str, Any] | EverestConfig,
         *,
         controls: ArrayLike | None = None,
         metadata: dict[str, Any] | None = None,
@@ -59,7 +55,9 @@ class EverestEnsembleEvaluator(HandlerMixin, DefaultEnsembleEvaluatorComputeStep
         parameters:
 
         **config**: The `config` dictionary should be a dictionary that can be validated
-        as an `EverestConfig` object.
+        as an `EverestConfig` object, which is done on every call. An already
+        validated `EverestConfig` object may also be passed, in which case it
+        is used without further validation.
 
         **controls**: The `controls` parameter can be a single vector, a
         sequence of multiple vectors, or a 2D matrix where the control vectors
@@ -81,9 +79,8 @@ class EverestEnsembleEvaluator(HandlerMixin, DefaultEnsembleEvaluatorComputeStep
         `optimization_output` directory.
 
         Args:
-            config:     An optional dictionary containing the Everest
-                        configuration. If omitted, the default configuration is
-                        used.
+            config:     A dictionary or `EverestConfig` object containing the
+                        Everest configuration.
             controls:   An array-like object containing the controls to evaluate.
             metadata:   An optional dictionary of metadata to associate with the
                         results.
@@ -92,59 +89,7 @@ class EverestEnsembleEvaluator(HandlerMixin, DefaultEnsembleEvaluatorComputeStep
         Returns:
             The exit code of the ensemble evaluator.
         """
-        from everest.config import EverestConfig
-        from everest.optimizer.everest2ropt import everest2ropt
-        from everest.optimizer.opt_model_transforms import (
-            get_optimization_domain_transforms,
-        )
-
-        everest_config = EverestConfig.with_plugins(config)
-        config_dict, initial_values = everest2ropt(
-            [
-                param
-                for control in everest_config.controls
-                for param in control.to_ert_parameter_config()
-            ],
-            everest_config.create_ert_objectives_config(),
-            everest_config.input_constraints,
-            everest_config.create_ert_output_constraints_config(),
-            everest_config.optimization,
-            everest_config.model,
-            everest_config.environment.random_seed,
-            everest_config.optimization_output_dir,
-        )
-
-        if output_dir is not None:
-            output_path = Path(output_dir)
-            if not output_path.is_absolute():
-                output_path = config_dict["optimizer"]["output_dir"] / output_path
-            config_dict["optimizer"]["output_dir"] = output_path
-            output_path.mkdir(parents=True, exist_ok=True)
-
-        enopt_config = EnOptConfig.model_validate(config_dict)
-
-        everest_transforms = get_optimization_domain_transforms(
-            [
-                param
-                for control in everest_config.controls
-                for param in control.to_ert_parameter_config()
-            ],
-            everest_config.create_ert_objectives_config(),
-            everest_config.input_constraints,
-            everest_config.create_ert_output_constraints_config(),
-            everest_config.model,
-            auto_scale=everest_config.optimization.auto_scale,
-        )
-
-        transforms = (
-            OptModelTransforms(
-                variables=everest_transforms["control_scaler"],
-                objectives=everest_transforms["objective_scaler"],
-                nonlinear_constraints=everest_transforms["constraint_scaler"],
-            )
-            if everest_transforms
-            else None
-        )
+        enopt_config, transforms, initial_values = everest_to_ropt(config, output_dir)
 
         return super().run(
             config=enopt_config,
@@ -1,23 +1,20 @@
 from __future__ import annotations
 
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from ropt.config import EnOptConfig
 from ropt.enums import ExitCode
 from ropt.plugins.compute_step.optimizer import DefaultOptimizerComputeStep
-from ropt.transforms import OptModelTransforms
 from ropt.workflow import create_compute_step
 
 from ._handler_mixin import HandlerMixin
+from ._utils import everest_to_ropt
 
 if TYPE_CHECKING:
+    from everest.config import EverestConfig
     from numpy.typing import ArrayLike
     from ropt.enums import ExitCode
     from ropt.plugins.evaluator.base import Evaluator
 
-# ruff: noqa: PLC0415
-
 
 class EverestOptimizer(HandlerMixin, DefaultOptimizerComputeStep):
     """The Everest optimizer class.
@@ -42,7 +39,7 @@ class EverestOptimizer(HandlerMixin, DefaultOptimizerComputeStep):
 
     def run(  # type: ignore[override]
         self,
-        config: dict[str, Any],
+        config: dict[str, Any] | EverestConfig,
         *,
         controls: ArrayLike | None = None,
         metadata: dict[str, Any] | None = None,
@@ -53,7 +50,9 @@ class EverestOptimizer(HandlerMixin, DefaultOptimizerComputeStep):
         This method executes the optimizer with the given parameters.
 
         **config**: The `config` dictionary should be a dictionary that can be validated
-        as an `EverestConfig` object.
+        as an `EverestConfig` object, which is done on every call. An already
+        validated `EverestConfig` object may also be passed, in which case it
+        is used without further validation.
 
         **controls**: If no controls are provided, the optimizer will use the
         initial values
@@ -74,9 +73,8 @@ class EverestOptimizer(HandlerMixin, DefaultOptimizerComputeStep):
         `optimization_output` directory.
 
         Args:
-            config:     An optional dictionary containing the Everest
-                        configuration. If omitted, the default configuration is
-                        used.
+            config:     A dictionary or `EverestConfig` object containing the
+                        Everest configuration.
             controls:   An array-like object containing the controls for the optimization.
             metadata:   An optional dictionary of metadata to associate with the
                         results.
@@ -85,59 +83,7 @@ class EverestOptimizer(HandlerMixin, DefaultOptimizerComputeStep):
         Returns:
             The exit code of the optimizer.
         """
-        from everest.config import EverestConfig
-        from everest.optimizer.everest2ropt import everest2ropt
-        from everest.optimizer.opt_model_transforms import (
-            get_optimization_domain_transforms,
-        )
-
-        everest_config = EverestConfig.with_plugins(config)
-        config_dict, initial_values = everest2ropt(
-            [
-                param
-                for control in everest_config.controls
-                for param in control.to_ert_parameter_config()
-            ],
-            everest_config.create_ert_objectives_config(),
-            everest_config.input_constraints,
-            everest_config.create_ert_output_constraints_config(),
-            everest_config.optimization,
-            everest_config.model,
-            everest_config.environment.random_seed,
-            everest_config.optimization_output_dir,
-        )
-
-        if output_dir is not None:
-            output_path = Path(output_dir)
-            if not output_path.is_absolute():
-                output_path = config_dict["optimizer"]["output_dir"] / output_path
-            config_dict["optimizer"]["output_dir"] = output_path
-            output_path.mkdir(parents=True, exist_ok=True)
-
-        enopt_config = EnOptConfig.model_validate(config_dict)
-
-        everest_transforms = get_optimization_domain_transforms(
-            [
-                param
-                for control in everest_config.controls
-                for param in control.to_ert_parameter_config()
-            ],
-            everest_config.create_ert_objectives_config(),
-            everest_config.input_constraints,
-            everest_config.create_ert_output_constraints_config(),
-            everest_config.model,
-            auto_scale=everest_config.optimization.auto_scale,
-        )
-
-        transforms = (
-            OptModelTransforms(
-                variables=everest_transforms["control_scaler"],
-                objectives=everest_transforms["objective_scaler"],
-                nonlinear_constraints=everest_transforms["constraint_scaler"],
-            )
-            if everest_transforms
-            else None
-        )
+        enopt_config, transforms, initial_values = everest_to_ropt(config, output_dir)
 
         return super().run(
             config=enopt_config,
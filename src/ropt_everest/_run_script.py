@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import sys
-from functools import partial
 from importlib.util import module_from_spec, spec_from_file_location
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -24,24 +23,23 @@ class EverestRunScriptComputeStep(ComputeStep):
         self, *, evaluator: EvaluatorCallback, script: Path | str
     ) -> Callable[..., ExitCode | None] | None:
         path = Path(script)
-        if path.exists():
-            module_name = path.stem
-            spec = spec_from_file_location(module_name, path)
-            if spec is None:
-                msg = f"Could not load {module_name}.py"
-                raise ImportError(msg)
-            module = module_from_spec(spec)
-            sys.modules[module_name] = module
-            assert spec.loader is not None
-            spec.loader.exec_module(module)
-
-            if hasattr(module, "run"):
-                return partial(_run_script, func=module.run, evaluator=evaluator)
-
-            msg = f"Function `run` not found in module {module_name}"
+        if not path.exists():
+            return None
+
+        module_name = path.stem
+        spec = spec_from_file_location(module_name, path)
+        if spec is None or spec.loader is None:
+            msg = f"Could not load {module_name}.py"
             raise ImportError(msg)
+        module = module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+
+        if hasattr(module, "run"):
+            return _bind_run_script(module.run, evaluator)
 
-        return None
+        msg = f"Function `run` not found in module {module_name}"
+        raise ImportError(msg)
 
 
 class _Evaluator(Evaluator):
@@ -62,3 +60,12 @@ def _run_script(
     return func(
         create_evaluator("everest/cached_evaluator", evaluator=function_evaluator)
     )
+
+
+def _bind_run_script(
+    func: Callable[[Evaluator], ExitCode | None], evaluator: EvaluatorCallback
+) -> Callable[[], ExitCode | None]:
+    def _run() -> ExitCode | None:
+        return _run_script(func, evaluator)
+
+    return _run
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from ropt.plugins.event_handler._store import DefaultStoreHandler  # noqa: PLC2701
 from ropt.results import FunctionResults, GradientResults, Results, results_to_dataframe
 
-from ._utils import TABLE_COLUMNS, TABLE_TYPE_MAP, fix_columns, reorder_columns
+from ._utils import (
+    TABLE_COLUMNS,
+    TABLE_TYPE_MAP,
+    finalize_dataframe,
+    get_table_columns,
+)
 
 if TYPE_CHECKING:
     import numpy as np
     import pandas as pd
     from numpy.typing import NDArray
 
+_EVALUATION_RESULTS: Final = (FunctionResults, GradientResults)
+
 
 class EverestStore(DefaultStoreHandler):
     """Provides access to the results generated by optimizers and evaluators.
@@ -43,13 +49,14 @@ class EverestStore(DefaultStoreHandler):
         Returns:
             The stored controls.
         """
-        if self["results"] is None:
+        results = self["results"]
+        if results is None:
             return None
-        assert isinstance(self["results"], list)
+        assert isinstance(results, list)
         return [
             item.evaluations.variables
-            for item in self["results"]
-            if isinstance(item, (FunctionResults, GradientResults))
+            for item in results
+            if isinstance(item, _EVALUATION_RESULTS)
         ]
 
     def reset(self) -> None:
@@ -94,19 +101,15 @@ class EverestStore(DefaultStoreHandler):
         if kind not in TABLE_COLUMNS:
             msg = f"Cannot make frame for `{kind}`"
             raise RuntimeError(msg)
-        if self["results"] is not None:
-            columns = deepcopy(TABLE_COLUMNS[kind])
-            if self["results"][0].metadata is not None:
-                for item in self["results"][0].metadata:
-                    columns[f"metadata.{item}"] = item
-            return fix_columns(
-                reorder_columns(
-                    results_to_dataframe(
-                        self["results"],
-                        fields=set(columns),
-                        result_type=TABLE_TYPE_MAP[kind],
-                    ),
-                    columns,
-                )
+        results = self["results"]
+        if results is not None:
+            columns = get_table_columns(kind, tuple(results[0].metadata or ()))
+            return finalize_dataframe(
+                results_to_dataframe(
+                    results,
+                    fields=set(columns),
+                    result_type=TABLE_TYPE_MAP[kind],
+                ),
+                columns,
             )
         return None
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import TYPE_CHECKING, Literal
 
 from ropt.plugins.event_handler._tracker import DefaultTrackerHandler  # noqa: PLC2701
 from ropt.results import FunctionResults, results_to_dataframe
 
-from ._utils import TABLE_COLUMNS, TABLE_TYPE_MAP, fix_columns, reorder_columns
+from ._utils import (
+    TABLE_COLUMNS,
+    TABLE_TYPE_MAP,
+    finalize_dataframe,
+    get_table_columns,
+)
 
 if TYPE_CHECKING:
     import numpy as np
@@ -98,19 +102,15 @@ class EverestTracker(DefaultTrackerHandler):
         if kind not in TABLE_COLUMNS:
             msg = f"Cannot make frame for `{kind}`"
             raise RuntimeError(msg)
-        if self["results"] is not None:
-            columns = deepcopy(TABLE_COLUMNS[kind])
-            if self["results"].metadata is not None:
-                for item in self["results"].metadata:
-                    columns[f"metadata.{item}"] = item
-            return fix_columns(
-                reorder_columns(
-                    results_to_dataframe(
-                        [self["results"]],
-                        fields=set(columns),
-                        result_type=TABLE_TYPE_MAP[kind],
-                    ),
-                    columns,
-                )
+        results = self["results"]
+        if results is not None:
+            columns = get_table_columns(kind, tuple(results.metadata or ()))
+            return finalize_dataframe(
+                results_to_dataframe(
+                    (results,),
+                    fields=set(columns),
+                    result_type=TABLE_TYPE_MAP[kind],
+                ),
+                columns,
             )
         return None
@@ -1,12 +1,27 @@
 from __future__ import annotations
 
 import os
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Final, Literal
+from typing import TYPE_CHECKING, Any, Final, Literal, NamedTuple
+
+from ropt.config import EnOptConfig
+from ropt.transforms import OptModelTransforms
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    import numpy as np
     import pandas as pd
+    from ert.config import (
+        EverestConstraintsConfig,
+        EverestControl,
+        EverestObjectivesConfig,
+    )
     from ert.run_models.everest_run_model import EverestExitCode
+    from everest.config import EverestConfig
+    from numpy.typing import NDArray
 
 # ruff: noqa: PLC0415
 
@@ -66,31 +81,215 @@ TABLE_TYPE_MAP: Final[dict[str, Literal["functions", "gradients"]]] = {
     "constraints": "functions",
 }
 
+_LOADED_CONFIGS_SIZE: Final = 4
+_LOADED_CONFIGS: dict[tuple[str, int, int], EverestConfig] = {}
+
+
+class _ConvertedConfig(NamedTuple):
+    everest_config: EverestConfig
+    config_dict: dict[str, Any]
+    initial_values: NDArray[np.float64]
+    parameters: list[EverestControl]
+    objectives: EverestObjectivesConfig
+    output_constraints: EverestConstraintsConfig | None
+
+
+@lru_cache(maxsize=32)
+def get_table_columns(kind: str, metadata: tuple[str, ...] = ()) -> tuple[str, ...]:
+    return (*TABLE_COLUMNS[kind], *(f"metadata.{item}" for item in metadata))
+
+
+def _reordered_columns(
+    data: pd.DataFrame, columns: list[str] | tuple[str, ...] | dict[str, str]
+) -> list[str | tuple[str, ...]]:
+    columns_by_key: dict[str, list[str | tuple[str, ...]]] = {}
+    for name in data.columns:
+        columns_by_key.setdefault(
+            name[0] if isinstance(name, tuple) else name, []
+        ).append(name)
+    return [name for key in columns for name in columns_by_key.get(key, ())]
+
 
 def reorder_columns(
-    data: pd.DataFrame, columns: list[str] | dict[str, str]
+    data: pd.DataFrame, columns: list[str] | tuple[str, ...] | dict[str, str]
 ) -> pd.DataFrame:
-    reordered_columns = [
-        name
-        for key in columns
-        for name in data.columns.to_numpy()
-        if name == key or (isinstance(name, tuple) and name[0] == key)
+    return data.reindex(columns=_reordered_columns(data, columns))
+
+
+@lru_cache(maxsize=256)
+def _strip_column_name(value: str) -> str:
+    _, _, new_value = value.partition(".")
+    return new_value.replace("variables", "controls")
+
+
+def _fix_column_names(data: pd.DataFrame) -> list[str | tuple[str, ...]]:
+    return [
+        (_strip_column_name(name[0]), *(str(item) for item in name[1:]))
+        if isinstance(name, tuple)
+        else _strip_column_name(name)
+        for name in data.columns
     ]
-    return data.reindex(columns=reordered_columns)
 
 
 def fix_columns(data: pd.DataFrame) -> pd.DataFrame:
-    def _strip(value: str) -> str:
-        _, _, new_value = value.partition(".")
-        return new_value.replace("variables", "controls")
+    return data.set_axis(_fix_column_names(data), axis="columns")
 
-    renamed_columns = [
-        (_strip(name[0]), *(str(item) for item in name[1:]))
-        if isinstance(name, tuple)
-        else _strip(name)
-        for name in data.columns.to_numpy()
+
+def finalize_dataframe(
+    data: pd.DataFrame, columns: list[str] | tuple[str, ...] | dict[str, str]
+) -> pd.DataFrame:
+    """Reorder and rename the columns of a results data frame.
+
+    This is equivalent to `fix_columns(reorder_columns(data, columns))`, but
+    builds only one new frame, instead of two. The frame passed in is not
+    modified.
+
+    Args:
+        data:    The data frame produced by `results_to_dataframe`.
+        columns: The column keys, in the order they should appear.
+
+    Returns:
+        The reordered data frame with the fixed column names.
+    """
+    reordered_columns = _reordered_columns(data, columns)
+    if reordered_columns == list(data.columns):
+        return data.set_axis(_fix_column_names(data), axis="columns")
+    data = data.reindex(columns=reordered_columns)
+    data.columns = _fix_column_names(data)
+    return data
+
+
+def _convert_config(config: dict[str, Any] | EverestConfig) -> _ConvertedConfig:
+    from everest.config import EverestConfig
+    from everest.optimizer.everest2ropt import everest2ropt
+
+    everest_config = (
+        config
+        if isinstance(config, EverestConfig)
+        else EverestConfig.with_plugins(config)
+    )
+
+    parameters = [
+        param
+        for control in everest_config.controls
+        for param in control.to_ert_parameter_config()
     ]
-    return data.set_axis(renamed_columns, axis="columns")
+    objectives = everest_config.create_ert_objectives_config()
+    output_constraints = everest_config.create_ert_output_constraints_config()
+
+    config_dict, initial_values = everest2ropt(
+        parameters,
+        objectives,
+        everest_config.input_constraints,
+        output_constraints,
+        everest_config.optimization,
+        everest_config.model,
+        everest_config.environment.random_seed,
+        everest_config.optimization_output_dir,
+    )
+
+    return _ConvertedConfig(
+        everest_config=everest_config,
+        config_dict=config_dict,
+        initial_values=initial_values,
+        parameters=parameters,
+        objectives=objectives,
+        output_constraints=output_constraints,
+    )
+
+
+def everest_to_ropt(
+    config: dict[str, Any] | EverestConfig, output_dir: str | None = None
+) -> tuple[EnOptConfig, OptModelTransforms | None, NDArray[np.float64]]:
+    """Convert an Everest configuration to the inputs of a ropt compute step.
+
+    A configuration dictionary is validated on every call. An `EverestConfig`
+    object is used as is, without further validation.
+
+    Args:
+        config:     An `EverestConfig` object, or a dictionary that can be
+                    validated as one.
+        output_dir: An optional output directory, relative to the optimizer
+                    output directory if not absolute.
+
+    Returns:
+        The optimizer configuration, the transforms and the initial controls.
+    """
+    from everest.optimizer.opt_model_transforms import (
+        get_optimization_domain_transforms,
+    )
+
+    converted = _convert_config(config)
+    everest_config = converted.everest_config
+    config_dict = converted.config_dict
+
+    if output_dir is not None:
+        output_path = Path(output_dir)
+        if not output_path.is_absolute():
+            output_path = config_dict["optimizer"]["output_dir"] / output_path
+        config_dict = {
+            **config_dict,
+            "optimizer": {**config_dict["optimizer"], "output_dir": output_path},
+        }
+        output_path.mkdir(parents=True, exist_ok=True)
+
+    enopt_config = EnOptConfig.model_validate(config_dict)
+
+    everest_transforms = get_optimization_domain_transforms(
+        converted.parameters,
+        converted.objectives,
+        everest_config.input_constraints,
+        converted.output_constraints,
+        everest_config.model,
+        auto_scale=everest_config.optimization.auto_scale,
+    )
+
+    transforms = (
+        OptModelTransforms(
+            variables=everest_transforms["control_scaler"],
+            objectives=everest_transforms["objective_scaler"],
+            nonlinear_constraints=everest_transforms["constraint_scaler"],
+        )
+        if everest_transforms
+        else None
+    )
+
+    return enopt_config, transforms, converted.initial_values.copy()
+
+
+def _load_everest_config(
+    config_file: str | Path, *, reload: bool = False
+) -> EverestConfig:
+    from everest.config import EverestConfig
+
+    path = Path(config_file).resolve()
+    try:
+        stat = path.stat()
+    except OSError:
+        # Let the Everest loader report a missing or unreadable file:
+        return EverestConfig.load_file(config_file)
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    config = _LOADED_CONFIGS.pop(key, None)
+    if config is None or reload:
+        config = EverestConfig.load_file(config_file)
+        if len(_LOADED_CONFIGS) >= _LOADED_CONFIGS_SIZE:
+            del _LOADED_CONFIGS[next(iter(_LOADED_CONFIGS))]
+    # Insert at the end, so that the least recently used entry is evicted first:
+    _LOADED_CONFIGS[key] = config
+    return config
+
+
+@contextmanager
+def _set_environ(name: str, value: str) -> Generator[None]:
+    saved = os.environ.get(name)
+    os.environ[name] = value
+    try:
+        yield
+    finally:
+        if saved is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = saved
 
 
 def load_config(config_file: str) -> dict[str, Any]:
@@ -99,27 +298,30 @@ def load_config(config_file: str) -> dict[str, Any]:
     This function reads an Everest configuration specified by the `config_file`
     path, parses it, and returns it as a Python dictionary.
 
+    If the file was already validated in this process and has not changed
+    since, it is not validated again. Changes to files that the configuration
+    refers to, such as installed jobs and data, are then not detected. Each
+    call returns a new dictionary.
+
     Args:
         config_file: The path to the Everest configuration YAML file.
 
     Returns:
         A dictionary representing the Everest configuration.
     """
-    from everest.config import EverestConfig
-
-    config: dict[str, Any] = EverestConfig.load_file(config_file).model_dump(
+    config: dict[str, Any] = _load_everest_config(config_file).model_dump(
         exclude_none=True
     )
     return config
 
 
 def run_everest(
-    config_file: str,
+    config_file: str | Path | EverestConfig,
     *,
     script: Path | str | None = None,
     report_exit_code: bool = True,
 ) -> EverestExitCode:
-    """Runs an Everest optimization directly from a configuration file.
+    """Runs an Everest optimization directly from a configuration.
 
     This function provides a convenient way to execute an Everest optimization
     workflow without having to use the `everest` command. This method will run a
@@ -136,12 +338,19 @@ def run_everest(
     - Exceptional exit conditions, such as maximum number batch reached, or
         a user abort are reported, if `report_exit_code` is set (the default).
 
+    The configuration is usually given as the path to an Everest configuration
+    file, which is read and validated on each call. An `EverestConfig` object
+    that was already loaded can be passed instead, in which case it is used
+    without reading the file. The run works on a copy of the configuration,
+    the object that is passed is not modified.
+
     The optional `script` argument is used to define a custom script that runs
     the optimization. If the file named by `script` does not exists, the
     argument is ignored and the default optimization workflow is run.
 
     Args:
-        config_file:      The path to the Everest configuration file (YAML).
+        config_file:      The path to the Everest configuration file (YAML),
+                          or an `EverestConfig` object.
         script:           Optional script to replace the default optimization.
         report_exit_code: If `True`, report the exit code.
 
@@ -156,22 +365,20 @@ def run_everest(
     from ert.run_models.everest_run_model import EverestExitCode, EverestRunModel
     from everest.config import EverestConfig
 
+    everest_config = (
+        config_file
+        if isinstance(config_file, EverestConfig)
+        else _load_everest_config(config_file, reload=True)
+    ).model_copy(deep=True)
     run_model = EverestRunModel.create(
-        EverestConfig.load_file(config_file), runtime_plugins=get_site_plugins()
+        everest_config, runtime_plugins=get_site_plugins()
     )
     if script is not None:
         if not Path(script).exists():
             msg = f"script does not exist: {script}"
             raise RuntimeError(msg)
-        env_var = os.environ.get("ROPT_SCRIPT", None)
-        try:
-            os.environ["ROPT_SCRIPT"] = str(script)
+        with _set_environ("ROPT_SCRIPT", str(script)):
             run_model.run_experiment(EvaluatorServerConfig())
-        finally:
-            if env_var is not None:
-                os.environ["ROPT_SCRIPT"] = env_var
-            else:
-                del os.environ["ROPT_SCRIPT"]
     else:
         run_model.run_experiment(EvaluatorServerConfig())
     if report_exit_code:
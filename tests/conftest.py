@@ -1,5 +1,5 @@
+import os
 import shutil
-import warnings
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -7,21 +7,6 @@ from typing import Any
 import pytest
 
 
-@pytest.fixture(autouse=True)
-def filter_warnings() -> None:
-    from ert.config import ConfigWarning  # noqa: PLC0415
-
-    warnings.filterwarnings(
-        "ignore",
-        message=".*Forward model might not write the required output.*",
-        category=ConfigWarning,
-    )
-    warnings.filterwarnings(
-        "ignore",
-        category=DeprecationWarning,
-    )
-
-
 @pytest.fixture
 def copy_data(tmp_path: Any, monkeypatch: Any) -> Callable[[str | Path], None]:
     def _copy_data(path: str | Path) -> None:
@@ -33,3 +18,21 @@ def copy_data(tmp_path: Any, monkeypatch: Any) -> Callable[[str | Path], None]:
         monkeypatch.chdir(tmp_path)
 
     return _copy_data
+
+
+@pytest.fixture(scope="session")
+def mathfunc(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("mathfunc")
+    shutil.copytree(
+        Path(__file__).parent.parent / "examples" / "mathfunc",
+        path,
+        dirs_exist_ok=True,
+    )
+    return path
+
+
+@pytest.fixture
+def copy_example(mathfunc: Path, tmp_path: Path, monkeypatch: Any) -> None:
+    # The examples only read their inputs, hence the files can be linked:
+    shutil.copytree(mathfunc, tmp_path, dirs_exist_ok=True, copy_function=os.link)
+    monkeypatch.chdir(tmp_path)
@@ -1,22 +1,23 @@
-import shutil
-from pathlib import Path
-from typing import Any
-
 import pytest
+from everest.config import EverestConfig
 
 from ropt_everest import run_everest
 
 
-def test_example_without_script(tmp_path: Path, monkeypatch: Any) -> None:
-    path = Path(__file__).parent.parent / "examples" / "mathfunc"
-    shutil.copytree(path, tmp_path, dirs_exist_ok=True)
-    monkeypatch.chdir(tmp_path)
+@pytest.mark.usefixtures("copy_example")
+def test_example_without_script() -> None:
     run_everest("config_example.yml")
 
 
-@pytest.mark.parametrize("filename", ["basic", "two", "loop", "evaluator"])
-def test_example(filename: str, tmp_path: Path, monkeypatch: Any) -> None:
-    path = Path(__file__).parent.parent / "examples" / "mathfunc"
-    shutil.copytree(path, tmp_path, dirs_exist_ok=True)
-    monkeypatch.chdir(tmp_path)
+@pytest.mark.usefixtures("copy_example")
+def test_example_with_config_object() -> None:
+    config = EverestConfig.load_file("config_example.yml")
+    saved = config.model_dump()
+    run_everest(config)
+    assert config.model_dump() == saved
+
+
+@pytest.mark.usefixtures("copy_example")
+@pytest.mark.parametrize("filename", ["basic", "two", "loop", "evaluator", "validated"])
+def test_example(filename: str) -> None:
     run_everest("config_example.yml", script=f"{filename}.py")
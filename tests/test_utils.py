@@ -0,0 +1,182 @@
+from collections.abc import Iterator
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+from everest.config import EverestConfig
+
+from ropt_everest import load_config
+from ropt_everest._utils import (
+    _LOADED_CONFIGS,
+    _LOADED_CONFIGS_SIZE,
+    _load_everest_config,
+    everest_to_ropt,
+    finalize_dataframe,
+    fix_columns,
+    get_table_columns,
+    reorder_columns,
+)
+
+
+def _count_validations(monkeypatch: Any) -> list[dict[str, Any]]:
+    calls: list[dict[str, Any]] = []
+    with_plugins = EverestConfig.with_plugins
+
+    def _with_plugins(config_dict: dict[str, Any]) -> EverestConfig:
+        calls.append(config_dict)
+        return with_plugins(config_dict)
+
+    monkeypatch.setattr(EverestConfig, "with_plugins", _with_plugins)
+    return calls
+
+
+@pytest.mark.usefixtures("copy_example")
+def test_everest_to_ropt_validates_dicts(monkeypatch: Any) -> None:
+    config = load_config("config_example.yml")
+    calls = _count_validations(monkeypatch)
+    everest_to_ropt(config)
+    everest_to_ropt(deepcopy(config))
+    assert len(calls) == 2
+
+
+@pytest.mark.usefixtures("copy_example")
+def test_everest_to_ropt_config_object(monkeypatch: Any) -> None:
+    config = EverestConfig.load_file("config_example.yml")
+    calls = _count_validations(monkeypatch)
+    enopt_config1, _, _ = everest_to_ropt(config)
+    enopt_config2, _, _ = everest_to_ropt(config.model_dump(exclude_none=True))
+    assert len(calls) == 1
+    np.testing.assert_equal(enopt_config1.model_dump(), enopt_config2.model_dump())
+
+
+@pytest.mark.usefixtures("copy_example")
+def test_everest_to_ropt_output_dir() -> None:
+    config = load_config("config_example.yml")
+    saved = deepcopy(config)
+    enopt_config, _, _ = everest_to_ropt(config)
+    output_dir = Path(enopt_config.optimizer.output_dir)
+    enopt_config, _, _ = everest_to_ropt(config, output_dir="output1")
+    assert Path(enopt_config.optimizer.output_dir) == output_dir / "output1"
+    assert (output_dir / "output1").is_dir()
+    enopt_config, _, _ = everest_to_ropt(config)
+    assert Path(enopt_config.optimizer.output_dir) == output_dir
+    assert config == saved
+
+
+@pytest.fixture
+def load_file_calls(monkeypatch: Any) -> Iterator[list[str]]:
+    calls: list[str] = []
+
+    def _load_file(config_file: str) -> object:
+        calls.append(str(config_file))
+        return object()
+
+    monkeypatch.setattr(EverestConfig, "load_file", _load_file)
+    saved = dict(_LOADED_CONFIGS)
+    _LOADED_CONFIGS.clear()
+    yield calls
+    _LOADED_CONFIGS.clear()
+    _LOADED_CONFIGS.update(saved)
+
+
+def test_load_everest_config_hit(tmp_path: Path, load_file_calls: list[str]) -> None:
+    path = tmp_path / "config.yml"
+    path.write_text("a")
+    config = _load_everest_config(path)
+    assert _load_everest_config(path) is config
+    assert _load_everest_config(str(path)) is config
+    assert len(load_file_calls) == 1
+
+
+def test_load_everest_config_changed(
+    tmp_path: Path, load_file_calls: list[str]
+) -> None:
+    path = tmp_path / "config.yml"
+    path.write_text("a")
+    config = _load_everest_config(path)
+    path.write_text("ab")
+    assert _load_everest_config(path) is not config
+    assert len(load_file_calls) == 2
+
+
+def test_load_everest_config_reload(tmp_path: Path, load_file_calls: list[str]) -> None:
+    path = tmp_path / "config.yml"
+    path.write_text("a")
+    config = _load_everest_config(path)
+    reloaded = _load_everest_config(path, reload=True)
+    assert reloaded is not config
+    assert _load_everest_config(path) is reloaded
+    assert len(load_file_calls) == 2
+    assert len(_LOADED_CONFIGS) == 1
+
+
+def test_load_everest_config_eviction(
+    tmp_path: Path, load_file_calls: list[str]
+) -> None:
+    paths = [tmp_path / f"config{idx}.yml" for idx in range(_LOADED_CONFIGS_SIZE + 1)]
+    for path in paths:
+        path.write_text("a")
+    configs = [_load_everest_config(path) for path in paths[:-1]]
+
+    # A hit moves the first file to the end, so that the second one is evicted:
+    assert _load_everest_config(paths[0]) is configs[0]
+    _load_everest_config(paths[-1])
+    assert len(_LOADED_CONFIGS) == _LOADED_CONFIGS_SIZE
+    assert _load_everest_config(paths[0]) is configs[0]
+    assert _load_everest_config(paths[1]) is not configs[1]
+    assert len(load_file_calls) == len(paths) + 1
+
+
+def test_load_everest_config_missing(
+    tmp_path: Path, load_file_calls: list[str]
+) -> None:
+    path = tmp_path / "missing.yml"
+    _load_everest_config(path)
+    _load_everest_config(path)
+    assert load_file_calls == [str(path), str(path)]
+    assert not _LOADED_CONFIGS
+
+
+@pytest.mark.parametrize(
+    "labels",
+    [
+        [
+            "batch_id",
+            ("functions.objectives", "f"),
+            ("evaluations.variables", "x"),
+            ("evaluations.variables", "y"),
+            "metadata.iteration",
+        ],
+        [
+            ("functions.objectives", "f"),
+            ("evaluations.variables", "x"),
+            "metadata.iteration",
+            "unused",
+            "batch_id",
+            ("evaluations.variables", "y"),
+        ],
+    ],
+    ids=["in-order", "out-of-order"],
+)
+def test_finalize_dataframe(labels: list[str | tuple[str, ...]]) -> None:
+    data = pd.DataFrame(
+        np.arange(2 * len(labels)).reshape(2, len(labels)),
+        columns=pd.Index(labels, tupleize_cols=False),
+    )
+    saved = data.copy()
+    columns = get_table_columns("results", ("iteration",))
+    finalized = finalize_dataframe(data, columns)
+    pd.testing.assert_frame_equal(
+        finalized, fix_columns(reorder_columns(data, columns))
+    )
+    assert list(finalized.columns) == [
+        "",
+        ("objectives", "f"),
+        ("controls", "x"),
+        ("controls", "y"),
+        "iteration",
+    ]
+    pd.testing.assert_frame_equal(data, saved)